@@ -10,17 +10,21 @@ Generates:
 """
 
 import os
-import glob
+import functools
+import hashlib
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, Optional
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg', force=True)
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.colors import LinearSegmentedColormap
-import seaborn as sns
+import matplotlib.colors as mcolors
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Polygon, Rectangle
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
@@ -53,43 +57,51 @@ BENCHMARK_COLORS = {
 }
 
 
+def _apply_style():
+    """Set global style - Premium modern aesthetic (applied once per process)."""
+    if getattr(_apply_style, '_done', False):
+        return
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams.update({
+        'font.family': 'sans-serif',
+        'font.sans-serif': ['Segoe UI', 'Arial', 'Helvetica', 'DejaVu Sans'],
+        'font.size': 12,
+        'axes.titlesize': 16,
+        'axes.titleweight': 'bold',
+        'axes.labelsize': 13,
+        'axes.labelweight': 'semibold',
+        'xtick.labelsize': 11,
+        'ytick.labelsize': 11,
+        'legend.fontsize': 11,
+        'legend.framealpha': 0.95,
+        'legend.edgecolor': '#E0E0E0',
+        'figure.titlesize': 18,
+        'figure.titleweight': 'bold',
+        'figure.facecolor': '#FAFBFC',
+        'axes.facecolor': '#FFFFFF',
+        'axes.edgecolor': '#D0D0D0',
+        'axes.linewidth': 1.5,
+        'grid.alpha': 0.25,
+        'grid.linestyle': '-',
+        'grid.linewidth': 0.8,
+    })
+    _apply_style._done = True
 
-# Set global style - Premium modern aesthetic
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams.update({
-    'font.family': 'sans-serif',
-    'font.sans-serif': ['Segoe UI', 'Arial', 'Helvetica', 'DejaVu Sans'],
-    'font.size': 12,
-    'axes.titlesize': 16,
-    'axes.titleweight': 'bold',
-    'axes.labelsize': 13,
-    'axes.labelweight': 'semibold',
-    'xtick.labelsize': 11,
-    'ytick.labelsize': 11,
-    'legend.fontsize': 11,
-    'legend.framealpha': 0.95,
-    'legend.edgecolor': '#E0E0E0',
-    'figure.titlesize': 18,
-    'figure.titleweight': 'bold',
-    'figure.facecolor': '#FAFBFC',
-    'axes.facecolor': '#FFFFFF',
-    'axes.edgecolor': '#D0D0D0',
-    'axes.linewidth': 1.5,
-    'grid.alpha': 0.25,
-    'grid.linestyle': '-',
-    'grid.linewidth': 0.8,
-})
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 RESULTS_DIR = PROJECT_DIR / 'results'
+CACHE_DIR = RESULTS_DIR / '.cache'
 OUTPUT_DIR = PROJECT_DIR / 'plots' / 'task2'
 
 # Ensure output directory exists
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 BENCHMARKS = ['specbzip', 'spechmmer', 'specmcf', 'specsjeng', 'speclibm']
+# Benchmark order and matching colors, for selecting the loaded subset with np.isin
+BENCH_ORDER = np.array(BENCHMARKS)
+BENCH_COLOR_ARR = np.array([BENCHMARK_COLORS[b] for b in BENCHMARKS])
 
 
 # =============================================================================
@@ -101,16 +113,34 @@ BENCHMARKS = ['specbzip', 'spechmmer', 'specmcf', 'specsjeng', 'speclibm']
 # PLOT 2: PER-BENCHMARK CPI PROGRESSION CURVE
 # =============================================================================
 
-def plot_cpi_progression_per_benchmark():
+def _style_progression_spines(ax):
+    """Clean spines with subtle styling (re-applied after every ax.clear())."""
+    for spine in ['top', 'right']:
+        ax.spines[spine].set_visible(False)
+    for spine in ['bottom', 'left']:
+        ax.spines[spine].set_color('#D0D0D0')
+        ax.spines[spine].set_linewidth(1.5)
+
+
+def plot_cpi_progression_per_benchmark(data: Optional[Dict[str, pd.DataFrame]] = None):
     """Create line charts showing CPI progression (sorted) for each benchmark."""
     print("📊 Generating Per-Benchmark CPI Progression Curves...")
+    _apply_style()
     
-    data = load_new_benchmark_results()
+    if data is None:
+        data = load_new_benchmark_results()
+    
+    # One figure with subtle background, cleared and redrawn per benchmark
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
+    fig.patch.set_facecolor('#FAFBFC')
     
     for benchmark in ['specsjeng']:  # Only generate for specsjeng
         if benchmark not in data:
             continue
 
+        ax.clear()
+        ax.set_facecolor('#FFFFFF')
+
         df = data[benchmark]
         
         # Prepare data: clean and sort
@@ -118,25 +148,25 @@ def plot_cpi_progression_per_benchmark():
         bench_data = bench_data.rename(columns={'Benchmarks': 'config', 'system.cpu.cpi': 'cpi'})
         bench_data = bench_data.dropna(subset=['cpi'])
 
-        bench_data = bench_data.sort_values('cpi', ascending=False).reset_index(drop=True)
-        
-        # Create figure with subtle background
-        fig, ax = plt.subplots(figsize=(12, 8))
-        fig.patch.set_facecolor('#FAFBFC')
-        ax.set_facecolor('#FFFFFF')
+        # Sort by descending CPI on the column alone; stable keeps ties in file order
+        order = np.argsort(-bench_data['cpi'].to_numpy(), kind='stable')
         
         # Get data
-        x = np.arange(len(bench_data))
-        cpis = bench_data['cpi'].values
-        configs = bench_data['config'].values
+        x = np.arange(len(order))
+        cpis = bench_data['cpi'].to_numpy()[order]
+        configs = bench_data['config'].to_numpy()[order]
         bench_color = BENCHMARK_COLORS.get(benchmark, '#2E86AB')
         
         # Create smooth gradient fill under curve
-        ax.fill_between(x, cpis, cpis[-1] * 0.9, alpha=0.08, color=bench_color)
-        for i in range(len(x) - 1):
-            gradient_alpha = 0.15 - (i / len(x)) * 0.08  # Fade gradient
-            ax.fill_between([x[i], x[i+1]], [cpis[i], cpis[i+1]], 
-                           alpha=gradient_alpha, color=bench_color)
+        shadow_fill = ax.fill_between(x, cpis, cpis[-1] * 0.9, alpha=0.08, color=bench_color)
+        shadow_fill.set_rasterized(True)
+        # Fade gradient: a single RGBA ramp image clipped to the area under the curve
+        gradient = np.tile(mcolors.to_rgba(bench_color), (1, 256, 1))
+        gradient[..., 3] = np.linspace(0.15, 0.15 - 0.08 * (len(x) - 2) / len(x), 256)
+        fade = ax.imshow(gradient, extent=(x[0], x[-1], 0, cpis.max()), origin='lower',
+                         aspect='auto', interpolation='bilinear', zorder=1)
+        fade.set_clip_path(Polygon(np.column_stack([np.r_[x[0], x, x[-1]], np.r_[0, cpis, 0]]),
+                                   transform=ax.transData))
         
         # Shadow line for depth effect
         ax.plot(x, cpis, '-', linewidth=6, color='#000000', alpha=0.08, zorder=4)
@@ -146,10 +176,10 @@ def plot_cpi_progression_per_benchmark():
                 solid_capstyle='round', solid_joinstyle='round')
         
         # Outer glow for scatter points
-        ax.scatter(x, cpis, c=bench_color, s=180, alpha=0.2, zorder=8)
+        ax.scatter(x, cpis, c=bench_color, s=180, alpha=0.2, zorder=8, rasterized=True)
         # Main scatter points with gradient effect
         ax.scatter(x, cpis, c=bench_color, s=120, edgecolors='white', 
-                  linewidth=2.5, zorder=10, alpha=0.95)
+                  linewidth=2.5, zorder=10, alpha=0.95, rasterized=True)
         
         # Best point with glow effect
         ax.scatter(x[-1], cpis[-1], c='#1ABC9C', s=500, alpha=0.2, zorder=13)  # Glow
@@ -162,9 +192,9 @@ def plot_cpi_progression_per_benchmark():
                   edgecolors='#FFFFFF', linewidth=2.5, zorder=15, label='Baseline')
         
         # Baseline reference line with style
-        baseline_mask = bench_data['config'].astype(str).str.contains('baseline|baseline', case=False)
+        baseline_mask = _is_baseline(bench_data['config'].astype(str))[order]
         if baseline_mask.any():
-            default_cpi = bench_data.loc[baseline_mask, 'cpi'].values[0]
+            default_cpi = cpis[baseline_mask][0]
             ax.hlines(y=default_cpi, xmin=x[0]-0.3, xmax=x[-1]+0.3, 
                       colors='#7F8C8D', linestyles='--', linewidth=2.5, alpha=0.6)
             ax.text(x[-1]+0.4, default_cpi, f'Baseline\n{default_cpi:.2f}', 
@@ -221,86 +251,184 @@ def plot_cpi_progression_per_benchmark():
         ax.xaxis.grid(True, linestyle='-', alpha=0.08, linewidth=0.5, color='#BDC3C7')
         ax.set_axisbelow(True)
         
-        # Clean spines with subtle styling
-        for spine in ['top', 'right']:
-            ax.spines[spine].set_visible(False)
-        for spine in ['bottom', 'left']:
-            ax.spines[spine].set_color('#D0D0D0')
-            ax.spines[spine].set_linewidth(1.5)
+        _style_progression_spines(ax)
         
         # Set y-axis limits with generous padding
         y_range = cpis[0] - cpis[-1]
         ax.set_ylim(cpis[-1] - y_range * 0.15, cpis[0] + y_range * 0.2)
         ax.set_xlim(x[0]-0.7, x[-1]+0.7)
 
-        plt.tight_layout(pad=2.0)
-        
         # Save with high quality
         output_path = OUTPUT_DIR / f'{benchmark}_cpi_progression.png'
-        plt.savefig(output_path, dpi=200, bbox_inches='tight', 
-                   facecolor='#FAFBFC', edgecolor='none')
-        plt.close()
+        fig.savefig(output_path, dpi=120, facecolor='#FAFBFC', edgecolor='none',
+                    pil_kwargs={'compress_level': 1})
         print(f"   ✅ Saved: {output_path}")
 
+    plt.close(fig)
+
 
 # =============================================================================
 # DATA LOADING
 # =============================================================================
 
+# Only these result columns are used; the label is a string, everything else a
+# float32 (ample precision for CPIs and miss rates, half the memory of float64)
+NEEDED_COLS = [
+    'Benchmarks',
+    'sim_seconds',
+    'system.cpu.cpi',
+    'system.cpu.dcache.overall_miss_rate::total',
+    'system.cpu.icache.overall_miss_rate::total',
+    'system.l2.overall_miss_rate::total',
+]
+DTYPES = {c: 'float32' for c in NEEDED_COLS[1:]} | {'Benchmarks': 'string'}
+
+# Labels (lowercase) that mark the default configuration in a results CSV
+BASELINE_LABELS = ('baseline', 'cfg1')
+
+
+def _read_results_csv(csv_path: Path) -> pd.DataFrame:
+    """Parse one results CSV, preferring the native pyarrow reader when installed."""
+    try:
+        # on_bad_lines='skip' to handle malformed rows
+        return pd.read_csv(csv_path, engine='pyarrow', on_bad_lines='skip',
+                           usecols=NEEDED_COLS, dtype=DTYPES)
+    except ImportError:
+        # C parser: strip padding after delimiters while tokenizing. It only
+        # skips over-long rows without usecols, so prune and cast afterwards.
+        df = pd.read_csv(csv_path, on_bad_lines='skip', skipinitialspace=True)
+    except (KeyError, ValueError):
+        # Older CSVs may lack a column or pad the header; read whole and trim names
+        df = pd.read_csv(csv_path, engine='pyarrow', on_bad_lines='skip')
+        df.columns = df.columns.str.strip()
+    # Columns missing from the file come back as all-NaN
+    return df.reindex(columns=NEEDED_COLS).astype(DTYPES)
+
+
+def _load_cached(fn: Callable[[], pd.DataFrame], cache_name: str,
+                 source_paths: Iterable[Path], schema=None) -> pd.DataFrame:
+    """Return fn() via a Parquet cache keyed by the sources' paths, mtimes and sizes.
+
+    ``schema`` (e.g. the dtype map fn parses with) is folded into the key so
+    changing it invalidates old entries.
+    """
+    stamps = sorted((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in source_paths)
+    key = repr((cache_name, schema, stamps))
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    cache_path = CACHE_DIR / f"{cache_name}-{digest}.parquet"
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except ImportError:
+            # No Parquet engine (pyarrow) installed: skip caching
+            return fn()
+        except (OSError, ValueError):  # ArrowInvalid is a ValueError
+            # Truncated or corrupt entry: drop it and rebuild below
+            cache_path.unlink(missing_ok=True)
+    df = fn()
+    CACHE_DIR.mkdir(exist_ok=True)
+    # Drop entries for older versions of the same sources. Only complete
+    # .parquet files: *.tmp names may be another worker's write in flight.
+    for stale in CACHE_DIR.glob(f"{cache_name}-*.parquet"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+    # Write to a temp name and rename, so an interrupted write never
+    # leaves a partial file under a valid cache key
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ImportError):
+        pass  # Caching is best-effort (no pyarrow, read-only dir); the parsed frame is still good
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return df
+
+
+@functools.lru_cache(maxsize=1)
 def load_new_benchmark_results() -> Dict[str, pd.DataFrame]:
-    """Load benchmark results from the new structure (results/spec*_results.csv)."""
+    """Load benchmark results from the new structure (results/spec*_results.csv).
+
+    The result is cached and shared between plots; callers must not mutate it.
+    """
     data = {}
-    for bench in BENCHMARKS:
-        csv_path = RESULTS_DIR / f"{bench}_results.csv"
-        if csv_path.exists():
-            try:
-                # Try with on_bad_lines='skip' to handle malformed rows
-                df = pd.read_csv(csv_path, on_bad_lines='skip')
-                df.columns = df.columns.str.strip()
-                data[bench] = df
-            except Exception as e:
-                print(f"   ⚠️ Warning: Could not load {bench}: {e}")
+    # One directory listing instead of an exists() stat per benchmark
+    available = {}
+    if RESULTS_DIR.is_dir():
+        with os.scandir(RESULTS_DIR) as entries:
+            available = {e.name: Path(e.path) for e in entries if e.is_file()}
+    paths = {bench: available[f"{bench}_results.csv"]
+             for bench in BENCHMARKS if f"{bench}_results.csv" in available}
+    # Parse the files concurrently; the CSV readers release the GIL while tokenizing
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {bench: pool.submit(_load_cached, functools.partial(_read_results_csv, path),
+                                      path.stem, [path], DTYPES)
+                   for bench, path in paths.items()}
+    for bench, future in futures.items():
+        try:
+            df = future.result()
+            # Locate the baseline once; plots read it back from attrs
+            df.attrs['baseline_idx'] = _find_baseline_idx(df)
+            data[bench] = df
+        except Exception as e:
+            print(f"   ⚠️ Warning: Could not load {bench}: {e}")
     return data
 
 
+def _is_baseline(labels: pd.Series) -> np.ndarray:
+    """Boolean mask of configuration labels naming the baseline."""
+    return np.isin(labels.str.lower().to_numpy(dtype=str, na_value=''), BASELINE_LABELS)
+
+
+def _find_baseline_idx(df: pd.DataFrame):
+    """Index label of the first baseline-labelled row, or None."""
+    mask = _is_baseline(df['Benchmarks'])
+    return df.index[mask][0] if mask.any() else None
+
+
+def _baseline_row(df: pd.DataFrame) -> pd.Series:
+    """Return the baseline configuration row (the highest-CPI row if none is labelled).
+
+    Uses the ``baseline_idx`` recorded at load time when present.
+    """
+    idx = df.attrs['baseline_idx'] if 'baseline_idx' in df.attrs else _find_baseline_idx(df)
+    if idx is None:
+        return df.loc[df['system.cpu.cpi'].idxmax()]
+    return df.loc[idx]
+
+
 # =============================================================================
 # PLOT 4: OPTIMIZATION IMPACT (Baseline vs Best)
 # =============================================================================
 
-def plot_optimization_impact():
+def plot_optimization_impact(data: Optional[Dict[str, pd.DataFrame]] = None):
     """Plot baseline vs best CPI with improvement percentages."""
     print("📊 Generating Optimization Impact Plot...")
+    _apply_style()
     
-    data = load_new_benchmark_results()
+    if data is None:
+        data = load_new_benchmark_results()
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = plt.subplots(figsize=(14, 8), layout='constrained')
     fig.patch.set_facecolor('#FAFBFC')
     ax.set_facecolor('#FFFFFF')
     
     width = 0.38
     
-    baseline_cpi = []
-    best_cpi = []
-    bench_names = []
+    bench_names = [b for b in BENCHMARKS if b in data]
     
-    for bench in BENCHMARKS:
-        if bench not in data:
-            continue
-        df = data[bench]
-        bench_names.append(bench)
-        
-        baseline_mask = df['Benchmarks'].str.contains('baseline|baseline', case=False, na=False)
-        if baseline_mask.any():
-            baseline_cpi.append(df.loc[baseline_mask, 'system.cpu.cpi'].values[0])
-        else:
-            baseline_cpi.append(df['system.cpu.cpi'].max())
-        best_cpi.append(df['system.cpu.cpi'].min())
+    # Best CPI per benchmark in one grouped reduction (sort=False keeps BENCHMARKS order)
+    combined = pd.concat([data[b][['system.cpu.cpi']].assign(benchmark=b) for b in bench_names],
+                         ignore_index=True)
+    best_cpi = combined.groupby('benchmark', sort=False)['system.cpu.cpi'].min().to_numpy()
+    baseline_cpi = np.array([_baseline_row(data[b])['system.cpu.cpi'] for b in bench_names])
     
     x = np.arange(len(bench_names))
     
-    # Shadow bars for depth
-    ax.bar(x - width/2 + 0.02, baseline_cpi, width, color='#000000', alpha=0.05)
-    ax.bar(x + width/2 + 0.02, best_cpi, width, color='#000000', alpha=0.05)
+    # Shadow bars for depth, as one collection
+    shadows = [Rectangle((xi - width + 0.02, 0), width, h) for xi, h in zip(x, baseline_cpi)]
+    shadows += [Rectangle((xi + 0.02, 0), width, h) for xi, h in zip(x, best_cpi)]
+    ax.add_collection(PatchCollection(shadows, facecolor='#000000', alpha=0.05, linewidth=0))
     
     # Baseline bars with gradient effect
     bars1 = ax.bar(x - width/2, baseline_cpi, width, label='Baseline (Default)', 
@@ -309,19 +437,14 @@ def plot_optimization_impact():
     
     # Best config bars with benchmark colors
     bars2 = ax.bar(x + width/2, best_cpi, width, label='Optimized', 
-                  color=[BENCHMARK_COLORS[b] for b in bench_names], alpha=0.9, 
+                  color=BENCH_COLOR_ARR[np.isin(BENCH_ORDER, bench_names)], alpha=0.9, 
                   edgecolor='white', linewidth=2.5, zorder=3)
     
     # Add value labels on bars
-    for bar, val in zip(bars1, baseline_cpi):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.15,
-               f'{val:.2f}', ha='center', va='bottom', fontsize=10, 
-               fontweight='bold', color='#7F8C8D')
-    
-    for bar, val in zip(bars2, best_cpi):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.15,
-               f'{val:.2f}', ha='center', va='bottom', fontsize=10, 
-               fontweight='bold', color='#2C3E50')
+    ax.bar_label(bars1, fmt='%.2f', padding=6, fontsize=10,
+                 fontweight='bold', color='#7F8C8D')
+    ax.bar_label(bars2, fmt='%.2f', padding=6, fontsize=10,
+                 fontweight='bold', color='#2C3E50')
     
     ax.set_ylabel('CPI (Cycles Per Instruction)', fontsize=13, fontweight='bold', color='#2C3E50')
     ax.set_xlabel('Benchmark', fontsize=13, fontweight='bold', color='#2C3E50')
@@ -352,10 +475,10 @@ def plot_optimization_impact():
     
     ax.set_ylim(0, max(baseline_cpi) * 1.25)
     
-    plt.tight_layout(pad=2.0)
     output_path = OUTPUT_DIR / 'optimization_impact.png'
-    plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
-    plt.close()
+    fig.savefig(output_path, dpi=150, facecolor='#FAFBFC',
+                pil_kwargs={'compress_level': 1})
+    plt.close(fig)
     print(f"   ✅ Saved: {output_path}")
 
 
@@ -364,34 +487,30 @@ def plot_optimization_impact():
 # PLOT 6: WORKLOAD CLASSIFICATION
 # =============================================================================
 
-def plot_workload_classification():
+def plot_workload_classification(data: Optional[Dict[str, pd.DataFrame]] = None):
     """Plot workload classification based on L2 miss rate vs CPI improvement."""
     print("📊 Generating Workload Classification Plot...")
+    _apply_style()
     
-    data = load_new_benchmark_results()
+    if data is None:
+        data = load_new_benchmark_results()
     
-    fig, ax = plt.subplots(figsize=(12, 9))
+    fig, ax = plt.subplots(figsize=(12, 9), layout='constrained')
     fig.patch.set_facecolor('#FAFBFC')
     ax.set_facecolor('#FFFFFF')
     
-    # Import Rectangle for background zones
-    from matplotlib.patches import Rectangle
-    
     l2_miss_values = []
     improvement_values = []
+    bench_names = []
     
     for bench in BENCHMARKS:
         if bench not in data:
             continue
         df = data[bench]
         
-        baseline_mask = df['Benchmarks'].str.contains('baseline|baseline', case=False, na=False)
-        if baseline_mask.any():
-            l2_miss = df.loc[baseline_mask, 'system.l2.overall_miss_rate::total'].values[0]
-            baseline_cpi = df.loc[baseline_mask, 'system.cpu.cpi'].values[0]
-        else:
-            l2_miss = df['system.l2.overall_miss_rate::total'].iloc[0]
-            baseline_cpi = df['system.cpu.cpi'].iloc[0]
+        baseline = _baseline_row(df)
+        l2_miss = baseline['system.l2.overall_miss_rate::total']
+        baseline_cpi = baseline['system.cpu.cpi']
         
         best_cpi = df['system.cpu.cpi'].min()
         improvement = (baseline_cpi - best_cpi) / baseline_cpi * 100
@@ -400,13 +519,7 @@ def plot_workload_classification():
         
         l2_miss_values.append(l2_miss * 100)
         improvement_values.append(improvement)
-        
-        # Outer glow effect
-        ax.scatter(l2_miss * 100, improvement, s=600, c=BENCHMARK_COLORS[bench], 
-                  alpha=0.15, zorder=3)
-        # Main point with premium styling
-        ax.scatter(l2_miss * 100, improvement, s=400, c=BENCHMARK_COLORS[bench], 
-                  edgecolors='white', linewidths=3, alpha=0.9, zorder=5)
+        bench_names.append(bench)
         
         # Premium label
         ax.annotate(bench.replace('spec', '').upper(), 
@@ -416,17 +529,31 @@ def plot_workload_classification():
                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
                             edgecolor=BENCHMARK_COLORS[bench], linewidth=1.5, alpha=0.9))
     
+    # All benchmarks in two collections: outer glow, then main points
+    point_colors = BENCH_COLOR_ARR[np.isin(BENCH_ORDER, bench_names)]
+    ax.scatter(l2_miss_values, improvement_values, s=600, c=point_colors,
+              alpha=0.15, zorder=3, rasterized=True)
+    ax.scatter(l2_miss_values, improvement_values, s=400, c=point_colors,
+              edgecolors='white', linewidths=3, alpha=0.9, zorder=5, rasterized=True)
+    
     # Trend line with confidence band effect
     if len(l2_miss_values) >= 2:
-        z = np.polyfit(l2_miss_values, improvement_values, 1)
-        p = np.poly1d(z)
+        # Closed-form least squares: slope, intercept and r from one set of sums
+        xs = np.asarray(l2_miss_values)
+        ys = np.asarray(improvement_values)
+        dx, dy = xs - xs.mean(), ys - ys.mean()
+        sxx, sxy, syy = (dx * dx).sum(), (dx * dy).sum(), (dy * dy).sum()
+        slope = sxy / sxx
+        intercept = ys.mean() - slope * xs.mean()
+        r = sxy / np.sqrt(sxx * syy)
         x_line = np.linspace(0, max(l2_miss_values) + 5, 100)
-        y_line = p(x_line)
+        y_line = slope * x_line + intercept
         
         # Confidence band - purple color to distinguish from memory-bound zone
-        ax.fill_between(x_line, y_line - 5, y_line + 5, alpha=0.1, color='#8B5CF6')
+        ax.fill_between(x_line, y_line - 5, y_line + 5, alpha=0.1, color='#8B5CF6',
+                        rasterized=True)
         ax.plot(x_line, y_line, '-', color='#7C3AED', linewidth=3, alpha=0.8,
-               label=f'Trend (ρ = {np.corrcoef(l2_miss_values, improvement_values)[0,1]:.2f})')
+               label=f'Trend (ρ = {r:.2f})')
     
     ax.set_xlabel('Baseline L2 Miss Rate (%)', fontsize=14, fontweight='bold', color='#2C3E50')
     ax.set_ylabel('CPI Improvement (%)', fontsize=14, fontweight='bold', color='#2C3E50')
@@ -468,10 +595,12 @@ def plot_workload_classification():
     ax.set_xlim(-5, max(l2_miss_values) + 15)
     ax.set_ylim(-5, max(improvement_values) + 15)
     
-    plt.tight_layout(pad=2.0)
     output_path = OUTPUT_DIR / 'workload_classification.png'
-    plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
-    plt.close()
+    fig.savefig(output_path, dpi=150, facecolor='#FAFBFC',
+                pil_kwargs={'compress_level': 1})
+    # Vector copy for print; only the rasterized points and band are bitmaps
+    fig.savefig(output_path.with_suffix('.pdf'), dpi=150, facecolor='#FAFBFC')
+    plt.close(fig)
     print(f"   ✅ Saved: {output_path}")
 
 
@@ -479,6 +608,15 @@ def plot_workload_classification():
 # MAIN EXECUTION
 # =============================================================================
 
+def _run_plot(plot_fn, data, what):
+    """Run one plot function in a worker process, reporting failures instead of raising."""
+    _apply_style()
+    try:
+        plot_fn(data)
+    except Exception as e:
+        print(f"   ❌ Error generating {what}: {e}")
+
+
 def main():
     """Generate all plots."""
     print("=" * 60)
@@ -493,21 +631,19 @@ def main():
         print("❌ Error: Results directory not found!")
         return
     
-    # Generate plots
-    try:
-        plot_cpi_progression_per_benchmark()
-    except Exception as e:
-        print(f"   ❌ Error generating CPI progression charts: {e}")
-    
-    try:
-        plot_optimization_impact()
-    except Exception as e:
-        print(f"   ❌ Error generating optimization impact plot: {e}")
+    # Load the results once and share them across all plots
+    data = load_new_benchmark_results()
     
-    try:
-        plot_workload_classification()
-    except Exception as e:
-        print(f"   ❌ Error generating workload classification plot: {e}")
+    # Generate plots; the figures are independent, so render them in parallel
+    plots = [
+        (plot_cpi_progression_per_benchmark, 'CPI progression charts'),
+        (plot_optimization_impact, 'optimization impact plot'),
+        (plot_workload_classification, 'workload classification plot'),
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_run_plot, fn, data, what) for fn, what in plots]
+        for future in futures:
+            future.result()
     
     print()
     print("=" * 60)
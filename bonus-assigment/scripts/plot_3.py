@@ -17,18 +17,21 @@ References:
 - Hennessy & Patterson 6th Ed., Chapter 2 - Tag overhead calculations
 """
 
-import os
+import argparse
+import functools
+import hashlib
 import warnings
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Tuple
-import math
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch
-import seaborn as sns
+import matplotlib.colors as mcolors
+from matplotlib.collections import PathCollection
+from matplotlib.quiver import Quiver
+from matplotlib.text import Annotation
 
 warnings.filterwarnings('ignore')
 
@@ -63,12 +66,17 @@ plt.rcParams.update({
     'axes.titleweight': 'bold',
     'figure.facecolor': '#FAFBFC',
     'axes.facecolor': '#FFFFFF',
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
 })
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 OUTPUT_DIR = PROJECT_DIR / 'plots' / 'task3'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+MANIFEST_PATH = OUTPUT_DIR / '.manifest'
+PLOT_OUTPUTS = ('cost_performance_tradeoff.png', 'cost_efficiency.png')
 
 # =============================================================================
 # PHYSICALLY-BASED ADDITIVE COST MODEL
@@ -82,12 +90,14 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 #
 # Combined: C = (S_L1 × γ_L1 + S_L2 × γ_L2) + Σ (S_i/CL × (T_w + σ)/8 × γ_i × (1 + δ × W_i))
 
-COST_PARAMS = {
-    'GAMMA_L1': 2.0,          # L1 cell density factor (8T SRAM ~2× larger than 6T)
-    'GAMMA_L2': 1.0,          # L2 baseline (6T SRAM)
-    'ADDR_WIDTH': 32,         # Address width in bits
-    'DELTA': 0.02,            # Logic overhead per way (~2% comparator/mux per way)
-}
+class CostParams(NamedTuple):
+    GAMMA_L1: float = 2.0     # L1 cell density factor (8T SRAM ~2× larger than 6T)
+    GAMMA_L2: float = 1.0     # L2 baseline (6T SRAM)
+    ADDR_WIDTH: int = 32      # Address width in bits
+    DELTA: float = 0.02       # Logic overhead per way (~2% comparator/mux per way)
+
+
+COST_PARAMS = CostParams()
 
 # =============================================================================
 # CONFIGURATION DATA
@@ -162,6 +172,11 @@ OPTIMAL_CONFIGS = {
     },
 }
 
+# Benchmark order and matching RGBA rows, parsed from hex once at import
+BENCHMARKS = np.array(list(OPTIMAL_CONFIGS))
+BENCH_RGBA = mcolors.to_rgba_array([BENCHMARK_COLORS[b] for b in BENCHMARKS])
+ARROW_ALPHA = 0.7  # Trade-off arrows: kept in the RGBA rows so recoloring can't drop it
+
 DEFAULT_CPIS = {
     'spechmmer': 1.188,
     'specmcf': 1.294,
@@ -175,35 +190,55 @@ DEFAULT_CPIS = {
 # ADDITIVE COST FUNCTION IMPLEMENTATION
 # =============================================================================
 
-def calculate_tag_width(cache_size_kb: int, cacheline_b: int, assoc: int) -> int:
-    """
-    Calculate tag width for a cache.
-    T_w = Address_width - log2(CL) - log2(Sets)
+CONFIG_FIELDS = ('L1i_size_KB', 'L1d_size_KB', 'L2_size_KB',
+                 'L1i_assoc', 'L1d_assoc', 'L2_assoc', 'cacheline_B')
+
+
+@dataclass(frozen=True, slots=True)
+class CostResult:
+    """Per-component cost: arrays from cost_components, floats from calculate_cost.
+    
+    float() gives the total of a single-config result.
     """
-    p = COST_PARAMS
-    cache_size_b = cache_size_kb * 1024  # Convert to bytes
-    num_lines = cache_size_b // cacheline_b
-    num_sets = num_lines // assoc if assoc > 0 else num_lines
+    c_data_l1: Union[float, np.ndarray]
+    c_data_l2: Union[float, np.ndarray]
+    l1i_overhead: Union[float, np.ndarray]
+    l1d_overhead: Union[float, np.ndarray]
+    l2_overhead: Union[float, np.ndarray]
+    
+    @property
+    def c_data(self) -> Union[float, np.ndarray]:
+        return self.c_data_l1 + self.c_data_l2
     
-    offset_bits = int(math.log2(cacheline_b)) if cacheline_b > 0 else 0
-    index_bits = int(math.log2(num_sets)) if num_sets > 1 else 0
-    tag_width = p['ADDR_WIDTH'] - offset_bits - index_bits
+    @property
+    def c_tag_logic(self) -> Union[float, np.ndarray]:
+        return self.l1i_overhead + self.l1d_overhead + self.l2_overhead
     
-    return max(tag_width, 1)  # At least 1 bit for tag
+    @property
+    def total(self) -> Union[float, np.ndarray]:
+        return self.c_data + self.c_tag_logic
+    
+    def __float__(self) -> float:
+        return float(np.asarray(self.total).item())
 
 
-def calculate_status_bits(assoc: int) -> int:
-    """
-    Calculate status bits per cache line.
-    σ = valid(1) + dirty(1) + LRU(log2(W)) ≈ 2 + log2(W)
-    """
-    lru_bits = int(math.ceil(math.log2(assoc))) if assoc > 1 else 0
-    return 2 + lru_bits
+CACHE_LEVELS = (('L1i', 'GAMMA_L1'), ('L1d', 'GAMMA_L1'), ('L2', 'GAMMA_L2'))
+
 
+def config_arrays(configs: List[Dict]) -> Dict[str, np.ndarray]:
+    """Pack a list of config dicts into struct-of-arrays columns."""
+    return {f: np.array([c[f] for c in configs], dtype=np.int64) for f in CONFIG_FIELDS}
 
-def calculate_cost(config: Dict) -> float:
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Elementwise int.bit_length() for non-negative integers (exact below 2**53)."""
+    return np.frexp(x)[1]
+
+
+def cost_components(configs: List[Dict], params: Optional[CostParams] = None) -> CostResult:
     """
-    Calculate hardware cost using ADDITIVE physical model.
+    Calculate hardware cost using ADDITIVE physical model, for every config
+    in one NumPy pass. This is the only implementation of the cost model.
     
     Formula: C_total = C_data + C_tag_and_logic
     
@@ -220,78 +255,71 @@ def calculate_cost(config: Dict) -> float:
     - T_w: Tag width in bits
     - σ: Status bits (valid + dirty + LRU)
     - δ = 0.02: Logic overhead per way (~2% comparator/mux per way)
-    """
-    p = COST_PARAMS
     
-    # L1 sizes
-    l1i_kb = config['L1i_size_KB']
-    l1d_kb = config['L1d_size_KB']
-    l1_total_kb = l1i_kb + l1d_kb
-    l2_kb = config['L2_size_KB']
-    cl = config['cacheline_B']
+    params defaults to the current COST_PARAMS. Returns a CostResult whose
+    fields are per-config arrays at full precision; round only when displaying.
+    """
+    p = COST_PARAMS if params is None else params
+    cfg = config_arrays(configs)
+    cl = cfg['cacheline_B']
+    if not np.all(cl & (cl - 1) == 0):
+        raise ValueError(f"cachelines {cl} are not all powers of two")
+    offset_bits = _bit_length(cl) - 1
+    
+    # Tag & Logic Overhead per cache: (S_KB / CL) × (T_w + σ) / 8 × γ × (1 + δ × W)
+    overheads = []
+    for level, gamma_key in CACHE_LEVELS:
+        size_kb = cfg[f'{level}_size_KB']
+        assoc = cfg[f'{level}_assoc']
+        gamma = getattr(p, gamma_key)
+        
+        num_sets = (size_kb * 1024 // cl) // np.maximum(assoc, 1)
+        if not np.all(num_sets & (num_sets - 1) == 0):
+            raise ValueError(f"{level} set counts {num_sets} are not all powers of two")
+        
+        # T_w = Address_width - log2(CL) - log2(Sets), at least 1 bit
+        index_bits = np.maximum(_bit_length(num_sets) - 1, 0)
+        tag_w = np.maximum(p.ADDR_WIDTH - offset_bits - index_bits, 1)
+        # σ = valid(1) + dirty(1) + LRU(ceil(log2(W)))
+        status = 2 + _bit_length(np.maximum(assoc, 1) - 1)
+        
+        overheads.append((size_kb / cl) * (tag_w + status) / 8 * gamma * (1 + p.DELTA * assoc))
     
     # Data Array Cost: C_data = S_L1 × γ_L1 + S_L2 × γ_L2
-    c_data = (l1_total_kb * p['GAMMA_L1']) + (l2_kb * p['GAMMA_L2'])
-    
-    # Tag & Logic Overhead for L1i: (S_KB / CL) × (T_w + σ) / 8 × γ × (1 + δ × W)
-    l1i_tag_w = calculate_tag_width(l1i_kb, cl, config['L1i_assoc'])
-    l1i_status = calculate_status_bits(config['L1i_assoc'])
-    l1i_overhead = (l1i_kb / cl) * (l1i_tag_w + l1i_status) / 8 * p['GAMMA_L1'] * (1 + p['DELTA'] * config['L1i_assoc'])
-    
-    # Tag & Logic Overhead for L1d: (S_KB / CL) × (T_w + σ) / 8 × γ × (1 + δ × W)
-    l1d_tag_w = calculate_tag_width(l1d_kb, cl, config['L1d_assoc'])
-    l1d_status = calculate_status_bits(config['L1d_assoc'])
-    l1d_overhead = (l1d_kb / cl) * (l1d_tag_w + l1d_status) / 8 * p['GAMMA_L1'] * (1 + p['DELTA'] * config['L1d_assoc'])
-    
-    # Tag & Logic Overhead for L2: (S_KB / CL) × (T_w + σ) / 8 × γ × (1 + δ × W)
-    l2_tag_w = calculate_tag_width(l2_kb, cl, config['L2_assoc'])
-    l2_status = calculate_status_bits(config['L2_assoc'])
-    l2_overhead = (l2_kb / cl) * (l2_tag_w + l2_status) / 8 * p['GAMMA_L2'] * (1 + p['DELTA'] * config['L2_assoc'])
-    
-    # Total tag/logic overhead
-    c_tag_logic = l1i_overhead + l1d_overhead + l2_overhead
-    
-    # Total cost (additive)
-    total = c_data + c_tag_logic
-    
-    return round(total, 1)
+    return CostResult((cfg['L1i_size_KB'] + cfg['L1d_size_KB']) * p.GAMMA_L1,
+                      cfg['L2_size_KB'] * p.GAMMA_L2,
+                      *overheads)
+
+
+def calculate_costs(configs: List[Dict], params: Optional[CostParams] = None) -> np.ndarray:
+    """Total cost of every configuration (see cost_components)."""
+    return cost_components(configs, params).total
+
+
+def calculate_cost(config: Dict, params: Optional[CostParams] = None) -> CostResult:
+    """Cost of a single configuration, as a CostResult of floats."""
+    values = tuple(config[f] for f in CONFIG_FIELDS)
+    return _cost_from_values(values, COST_PARAMS if params is None else params)
+
+
+@functools.lru_cache(maxsize=None)
+def _cost_from_values(values: Tuple[int, ...], params: CostParams) -> CostResult:
+    """calculate_cost memoized on (config values, cost params)."""
+    cost = cost_components([dict(zip(CONFIG_FIELDS, values))], params)
+    return CostResult(*(float(getattr(cost, f.name)[0]) for f in fields(CostResult)))
 
 
 def calculate_cost_breakdown(config: Dict) -> Dict[str, float]:
     """Get detailed cost breakdown for visualization."""
-    p = COST_PARAMS
-    
-    l1i_kb = config['L1i_size_KB']
-    l1d_kb = config['L1d_size_KB']
-    l1_total_kb = l1i_kb + l1d_kb
-    l2_kb = config['L2_size_KB']
-    cl = config['cacheline_B']
-    
-    # Data Array Cost
-    c_data_l1 = l1_total_kb * p['GAMMA_L1']
-    c_data_l2 = l2_kb * p['GAMMA_L2']
-    c_data = c_data_l1 + c_data_l2
-    
-    # Tag & Logic Overhead (full per-cache calculation, same as calculate_cost)
-    avg_ways = (config['L1i_assoc'] + config['L1d_assoc'] + config['L2_assoc']) / 3
-    tag_overhead = 0.0
-    for sz, assoc, gamma in [(l1i_kb, config['L1i_assoc'], p['GAMMA_L1']),
-                              (l1d_kb, config['L1d_assoc'], p['GAMMA_L1']),
-                              (l2_kb, config['L2_assoc'], p['GAMMA_L2'])]:
-        tw = calculate_tag_width(sz, cl, assoc)
-        st = calculate_status_bits(assoc)
-        tag_overhead += (sz / cl) * (tw + st) / 8 * gamma * (1 + p['DELTA'] * assoc)
-    
-    total = c_data + tag_overhead
-    
+    cost = calculate_cost(config)
     return {
-        'c_data_l1': c_data_l1,
-        'c_data_l2': c_data_l2,
-        'c_data': c_data,
-        'tag_overhead': tag_overhead,
-        'avg_ways': avg_ways,
-        'cacheline': cl,
-        'total': total,
+        'c_data_l1': cost.c_data_l1,
+        'c_data_l2': cost.c_data_l2,
+        'c_data': cost.c_data,
+        'tag_overhead': cost.c_tag_logic,
+        'avg_ways': (config['L1i_assoc'] + config['L1d_assoc'] + config['L2_assoc']) / 3,
+        'cacheline': config['cacheline_B'],
+        'total': cost.total,
     }
 
 
@@ -301,50 +329,73 @@ def calculate_cost_breakdown(config: Dict) -> Dict[str, float]:
 
 def analyze_all_configs() -> pd.DataFrame:
     """Analyze cost and performance for all configurations."""
-    results = []
-    
-    for bench, default_cpi in DEFAULT_CPIS.items():
-        default_cost = calculate_cost(DEFAULT_CONFIG)
-        results.append({
-            'benchmark': bench,
-            'config_type': 'Default',
-            'cpi': default_cpi,
-            'cost': default_cost,
-            'cost_performance': default_cpi * default_cost,
-            'L1_total_KB': DEFAULT_CONFIG['L1i_size_KB'] + DEFAULT_CONFIG['L1d_size_KB'],
-            'L2_KB': DEFAULT_CONFIG['L2_size_KB'],
-            'cacheline_B': DEFAULT_CONFIG['cacheline_B'],
-        })
-    
-    for bench, config in OPTIMAL_CONFIGS.items():
-        opt_cost = calculate_cost(config)
-        results.append({
-            'benchmark': bench,
-            'config_type': 'Optimized',
-            'cpi': config['cpi'],
-            'cost': opt_cost,
-            'cost_performance': config['cpi'] * opt_cost,
-            'L1_total_KB': config['L1i_size_KB'] + config['L1d_size_KB'],
-            'L2_KB': config['L2_size_KB'],
-            'cacheline_B': config['cacheline_B'],
-        })
-    
-    return pd.DataFrame(results)
+    n_default, n_opt = len(DEFAULT_CPIS), len(OPTIMAL_CONFIGS)
+    configs = [DEFAULT_CONFIG] * n_default + list(OPTIMAL_CONFIGS.values())
+    cfg = config_arrays(configs)
+    
+    cpi = np.array(list(DEFAULT_CPIS.values()) + [c['cpi'] for c in OPTIMAL_CONFIGS.values()])
+    # Every benchmark shares DEFAULT_CONFIG: cost it once, then broadcast
+    unique_cost = cost_components([DEFAULT_CONFIG, *OPTIMAL_CONFIGS.values()])
+    take = np.r_[np.zeros(n_default, dtype=int), np.arange(1, n_opt + 1)]
+    cost = unique_cost.total[take]
+    
+    df = pd.DataFrame({
+        'benchmark': list(DEFAULT_CPIS) + list(OPTIMAL_CONFIGS),
+        'config_type': ['Default'] * n_default + ['Optimized'] * n_opt,
+        'cpi': cpi,
+        'cost': cost,
+        'cost_performance': cpi * cost,
+        'c_data': unique_cost.c_data[take],
+        'tag_overhead': unique_cost.c_tag_logic[take],
+        'L1_total_KB': cfg['L1i_size_KB'] + cfg['L1d_size_KB'],
+        'L2_KB': cfg['L2_size_KB'],
+        'cacheline_B': cfg['cacheline_B'],
+    })
+    # (benchmark, config_type) index: O(1) lookups instead of boolean masks
+    return df.set_index(['benchmark', 'config_type']).sort_index()
 
 
 # =============================================================================
 # VISUALIZATION
 # =============================================================================
 
-def plot_cost_performance_tradeoff():
-    """Plot cost vs CPI with iso-cost-performance curves."""
+def _prepare_figure(fig: Optional[plt.Figure], figsize: Tuple[float, float]):
+    """Clear and resize a reused figure (or create one) and give it a single axes."""
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    fig.patch.set_facecolor('#FAFBFC')
+    ax = fig.add_subplot(111)
+    ax.set_facecolor('#FFFFFF')
+    return fig, ax
+
+
+class TradeoffArtists(NamedTuple):
+    """Live handles to the trade-off plot, for in-place updates via update_tradeoff."""
+    fig: plt.Figure
+    ax: plt.Axes
+    benchmarks: np.ndarray
+    default_pts: PathCollection
+    optimized_pts: PathCollection
+    arrows: Quiver
+    labels: List[Annotation]
+
+
+def plot_cost_performance_tradeoff(fig: Optional[plt.Figure] = None,
+                                   keep_open: bool = False) -> Optional[TradeoffArtists]:
+    """
+    Plot cost vs CPI with iso-cost-performance curves.
+    Returns the live artists for update_tradeoff, or None when the figure was
+    created here and closed after saving (pass keep_open=True to keep it).
+    """
     print("📊 Generating Cost vs Performance Trade-off Plot...")
     
     df = analyze_all_configs()
     
-    fig, ax = plt.subplots(figsize=(14, 10))
-    fig.patch.set_facecolor('#FAFBFC')
-    ax.set_facecolor('#FFFFFF')
+    owns_fig = fig is None
+    fig, ax = _prepare_figure(fig, (14, 10))
     
     # Custom label offsets for each benchmark (x_offset, y_offset)
     LABEL_OFFSETS = {
@@ -355,55 +406,58 @@ def plot_cost_performance_tradeoff():
         'specbzip': (12, 12),      # Default
     }
     
-    for bench in OPTIMAL_CONFIGS.keys():
-        # Skip mcf as requested
-        if bench == 'specmcf':
-            continue
-        bench_df = df[df['benchmark'] == bench]
-        color = BENCHMARK_COLORS[bench]
-        
-        default = bench_df[bench_df['config_type'] == 'Default'].iloc[0]
-        optimized = bench_df[bench_df['config_type'] == 'Optimized'].iloc[0]
-        
-        # Arrow from default to optimized
-        ax.annotate('', xy=(optimized['cost'], optimized['cpi']),
-                   xytext=(default['cost'], default['cpi']),
-                   arrowprops=dict(arrowstyle='->', color=color, lw=2.5, alpha=0.7))
-        
-        # Default (hollow circle)
-        ax.scatter(default['cost'], default['cpi'], s=280, 
-                  facecolors='white', edgecolors=color, linewidths=3, 
-                  zorder=5, marker='o')
-        
-        # Optimized (filled star)
-        ax.scatter(optimized['cost'], optimized['cpi'], s=400, 
-                  c=color, edgecolors='white', linewidths=2.5, 
-                  zorder=6, marker='*')
-        
-        # Label with custom position
+    # Skip mcf as requested
+    keep = BENCHMARKS != 'specmcf'
+    benches = BENCHMARKS[keep]
+    default = df.xs('Default', level='config_type').loc[benches]
+    optimized = df.xs('Optimized', level='config_type').loc[benches]
+    xs_def, ys_def = default['cost'].to_numpy(), default['cpi'].to_numpy()
+    xs_opt, ys_opt = optimized['cost'].to_numpy(), optimized['cpi'].to_numpy()
+    colors = BENCH_RGBA[keep]
+    
+    # Arrows from default to optimized (one quiver for all benchmarks)
+    arrow_colors = colors.copy()
+    arrow_colors[:, 3] *= ARROW_ALPHA
+    arrows = ax.quiver(xs_def, ys_def, xs_opt - xs_def, ys_opt - ys_def, color=arrow_colors,
+                       angles='xy', scale_units='xy', scale=1,
+                       width=0.003, headwidth=4, headlength=5, headaxislength=4.5, zorder=4)
+    
+    # Default (hollow circles)
+    default_pts = ax.scatter(xs_def, ys_def, s=280, 
+                            facecolors='white', edgecolors=colors, linewidths=3, 
+                            zorder=5, marker='o', rasterized=True)
+    
+    # Optimized (filled stars)
+    optimized_pts = ax.scatter(xs_opt, ys_opt, s=400, 
+                              c=colors, edgecolors='white', linewidths=2.5, 
+                              zorder=6, marker='*', rasterized=True)
+    
+    # Labels with custom positions
+    labels = []
+    for bench, x, y, color in zip(benches, xs_opt, ys_opt, colors):
         offset = LABEL_OFFSETS.get(bench, (12, 8))
-        ax.annotate(bench.replace('spec', '').upper(),
-                   (optimized['cost'], optimized['cpi']),
+        labels.append(ax.annotate(bench.replace('spec', '').upper(), (x, y),
                    xytext=offset, textcoords='offset points',
                    fontsize=12, fontweight='bold', color='#2C3E50',
                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white',
-                            edgecolor=color, linewidth=2, alpha=0.95))
+                            edgecolor=color, linewidth=2, alpha=0.95)))
     
-    # Iso-cost-performance curves (CPI × Cost = constant)
+    # Iso-cost-performance curves (CPI × Cost = constant), traced as contours of Z = X·Y
     max_cost = df['cost'].max() * 1.3
+    X, Y = np.meshgrid(np.linspace(50, max_cost, 200), np.linspace(0.5, 12, 200))
+    levels = np.array([500, 2000, 5000, 15000])
+    iso = ax.contour(X, Y, X * Y, levels=levels, colors='#BDC3C7',
+                     linestyles='--', alpha=0.6, linewidths=1.5, rasterized=True)
+    # Fixed-angle labels a third of the way along each curve's visible span. Not
+    # ax.clabel: it cuts gaps into the dashes and rotates labels onto the arrows.
     costs = np.linspace(50, max_cost, 100)
-    for cp_value in [500, 2000, 5000, 15000]:
-        cpis = cp_value / costs
-        valid = (cpis <= 12) & (cpis >= 0.5)
-        if valid.any():
-            ax.plot(costs[valid], cpis[valid], '--', color='#BDC3C7', 
-                   alpha=0.6, linewidth=1.5)
-            idx = len(cpis[valid]) // 3
-            if idx < len(costs[valid]):
-                label_text = f'{cp_value}' if cp_value < 1000 else f'{cp_value//1000}k'
-                ax.text(costs[valid][idx], cpis[valid][idx], 
-                       f'CPI×Cost={label_text}', fontsize=9, color='#7F8C8D',
-                       rotation=-30, ha='center', va='bottom', style='italic')
+    for level in levels:
+        visible = costs[(level / costs <= 12) & (level / costs >= 0.5)]
+        if visible.size:
+            x = visible[visible.size // 3]
+            label_text = f'{level}' if level < 1000 else f'{level // 1000}k'
+            ax.text(x, level / x, f'CPI×Cost={label_text}', fontsize=9, color='#7F8C8D',
+                    rotation=-30, ha='center', va='bottom', style='italic')
     
     # Enhanced Legend
     legend_elements = [
@@ -444,51 +498,73 @@ def plot_cost_performance_tradeoff():
     ax.set_xlim(0, max_cost)
     ax.set_ylim(0, 12)
     
-    plt.tight_layout(pad=2.0)
+    fig.tight_layout(pad=2.0)
     output_path = OUTPUT_DIR / 'cost_performance_tradeoff.png'
-    plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
-    plt.close()
+    fig.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
     print(f"   ✅ Saved: {output_path}")
+    if owns_fig and not keep_open:
+        plt.close(fig)
+        return None
+    
+    return TradeoffArtists(fig, ax, benches, default_pts, optimized_pts, arrows, labels)
 
 
-def plot_cost_efficiency():
+def update_tradeoff(artists: TradeoffArtists, configs: Dict[str, Dict],
+                    colors: Optional[np.ndarray] = None) -> None:
+    """
+    Move the optimized stars, arrows and labels to new per-benchmark configs
+    (e.g. from a sweep slider) without rebuilding the figure.
+    configs maps each plotted benchmark to a config dict with a 'cpi' entry;
+    colors, if given, recolors the moving artists (stars, arrows, label
+    frames) with one RGBA row per plotted benchmark; arrows get ARROW_ALPHA
+    on top of each row's alpha.
+    """
+    new_configs = [configs[b] for b in artists.benchmarks]
+    opt = np.c_[calculate_costs(new_configs), [c['cpi'] for c in new_configs]]
+    delta = opt - artists.default_pts.get_offsets()
+    
+    artists.optimized_pts.set_offsets(opt)
+    artists.arrows.set_UVC(delta[:, 0], delta[:, 1])
+    for label, xy in zip(artists.labels, opt):
+        label.xy = tuple(xy)
+    
+    if colors is not None:
+        artists.optimized_pts.set_facecolors(colors)
+        arrow_colors = mcolors.to_rgba_array(colors)
+        arrow_colors[:, 3] *= ARROW_ALPHA
+        artists.arrows.set_color(arrow_colors)
+        for label, color in zip(artists.labels, colors):
+            label.get_bbox_patch().set_edgecolor(color)
+    artists.fig.canvas.draw_idle()
+
+
+def plot_cost_efficiency(fig: Optional[plt.Figure] = None):
     """Plot cost-performance product comparison."""
     print("📊 Generating Cost Efficiency Plot...")
     
     df = analyze_all_configs()
     
-    fig, ax = plt.subplots(figsize=(14, 8))
-    fig.patch.set_facecolor('#FAFBFC')
-    ax.set_facecolor('#FFFFFF')
+    owns_fig = fig is None
+    fig, ax = _prepare_figure(fig, (14, 8))
     
-    benchmarks = list(OPTIMAL_CONFIGS.keys())
+    benchmarks = BENCHMARKS
     x = np.arange(len(benchmarks))
     width = 0.35
     
-    default_cp = []
-    optimized_cp = []
-    
-    for bench in benchmarks:
-        bench_df = df[df['benchmark'] == bench]
-        default_cp.append(bench_df[bench_df['config_type'] == 'Default']['cost_performance'].values[0])
-        optimized_cp.append(bench_df[bench_df['config_type'] == 'Optimized']['cost_performance'].values[0])
+    default_cp = df.xs('Default', level='config_type')['cost_performance'].loc[benchmarks].to_numpy()
+    optimized_cp = df.xs('Optimized', level='config_type')['cost_performance'].loc[benchmarks].to_numpy()
     
     bars1 = ax.bar(x - width/2, default_cp, width, label='Default',
                   color='#95A5A6', edgecolor='white', linewidth=2)
     bars2 = ax.bar(x + width/2, optimized_cp, width, label='Optimized',
-                  color=[BENCHMARK_COLORS[b] for b in benchmarks],
+                  color=BENCH_RGBA,
                   edgecolor='white', linewidth=2)
     
-    # Value labels
-    for bar, val in zip(bars1, default_cp):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 800,
-               f'{val/1000:.1f}k', ha='center', va='bottom', fontsize=9,
-               fontweight='bold', color='#7F8C8D')
-    
-    for bar, val in zip(bars2, optimized_cp):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 800,
-               f'{val/1000:.1f}k', ha='center', va='bottom', fontsize=9,
-               fontweight='bold', color='#2C3E50')
+    # Value labels (padding ≈ the old +800 data-unit offset)
+    ax.bar_label(bars1, labels=[f'{v/1000:.1f}k' for v in default_cp], padding=12,
+                 fontsize=9, fontweight='bold', color='#7F8C8D')
+    ax.bar_label(bars2, labels=[f'{v/1000:.1f}k' for v in optimized_cp], padding=12,
+                 fontsize=9, fontweight='bold', color='#2C3E50')
     
     # Improvement badges - moved closer to bars
     for i, (d, o) in enumerate(zip(default_cp, optimized_cp)):
@@ -517,10 +593,11 @@ def plot_cost_efficiency():
     
     ax.set_ylim(0, max(default_cp) * 1.20)
     
-    plt.tight_layout(pad=2.0)
+    fig.tight_layout(pad=2.0)
     output_path = OUTPUT_DIR / 'cost_efficiency.png'
-    plt.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
-    plt.close()
+    fig.savefig(output_path, dpi=200, bbox_inches='tight', facecolor='#FAFBFC')
+    if owns_fig:
+        plt.close(fig)
     print(f"   ✅ Saved: {output_path}")
 
 
@@ -535,24 +612,22 @@ def print_analysis_table():
     print(f"\n{'Benchmark':<12} {'Config':<10} {'CPI':>8} {'Cost':>10} {'CPI×Cost':>12} {'Δ Efficiency':>14}")
     print("-" * 80)
     
-    for bench in OPTIMAL_CONFIGS.keys():
-        bench_df = df[df['benchmark'] == bench]
-        default = bench_df[bench_df['config_type'] == 'Default'].iloc[0]
-        optimized = bench_df[bench_df['config_type'] == 'Optimized'].iloc[0]
-        
-        efficiency_change = (default['cost_performance'] - optimized['cost_performance']) / default['cost_performance'] * 100
-        
-        print(f"{bench:<12} {'Default':<10} {default['cpi']:>8.3f} {default['cost']:>10.0f} {default['cost_performance']:>12.0f}")
-        print(f"{'':<12} {'Optimized':<10} {optimized['cpi']:>8.3f} {optimized['cost']:>10.0f} {optimized['cost_performance']:>12.0f} {efficiency_change:>+13.1f}%")
+    benchmarks = list(OPTIMAL_CONFIGS.keys())
+    default = df.xs('Default', level='config_type').loc[benchmarks]
+    optimized = df.xs('Optimized', level='config_type').loc[benchmarks]
+    efficiency_change = (default['cost_performance'] - optimized['cost_performance']) / default['cost_performance'] * 100
+    
+    for d, o, change in zip(default.itertuples(), optimized.itertuples(), efficiency_change):
+        print(f"{d.Index:<12} {'Default':<10} {d.cpi:>8.3f} {d.cost:>10.0f} {d.cost_performance:>12.0f}")
+        print(f"{'':<12} {'Optimized':<10} {o.cpi:>8.3f} {o.cost:>10.0f} {o.cost_performance:>12.0f} {change:>+13.1f}%")
         print()
     
     print("=" * 100)
     
-    opt_df = df[df['config_type'] == 'Optimized']
-    best_idx = opt_df['cost_performance'].idxmin()
-    best = opt_df.loc[best_idx]
+    best_bench = optimized['cost_performance'].idxmin()
+    best = optimized.loc[best_bench]
     
-    print(f"\n🏆 BEST COST-EFFICIENCY: {best['benchmark'].replace('spec', '').upper()}")
+    print(f"\n🏆 BEST COST-EFFICIENCY: {best_bench.replace('spec', '').upper()}")
     print(f"   CPI × Cost = {best['cost_performance']:.0f} (CPI={best['cpi']:.3f}, Cost={best['cost']:.0f})")
     
     return df
@@ -562,8 +637,26 @@ def print_analysis_table():
 # MAIN EXECUTION
 # =============================================================================
 
-def main():
-    """Generate all cost analysis outputs."""
+def _inputs_digest() -> str:
+    """Hash of every model input the plots are drawn from."""
+    key = repr((DEFAULT_CONFIG, OPTIMAL_CONFIGS, DEFAULT_CPIS, COST_PARAMS))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _plots_up_to_date(digest: str) -> bool:
+    """True if the manifest matches and every plot is newer than this script."""
+    try:
+        if MANIFEST_PATH.read_text().strip() != digest:
+            return False
+        script_mtime = Path(__file__).stat().st_mtime_ns
+        return all((OUTPUT_DIR / name).stat().st_mtime_ns >= script_mtime
+                   for name in PLOT_OUTPUTS)
+    except FileNotFoundError:
+        return False
+
+
+def main(force: bool = False):
+    """Generate all cost analysis outputs (plots are skipped when up to date)."""
     print("=" * 70)
     print("💰 PHYSICALLY-BASED ADDITIVE COST ANALYSIS")
     print("   Model: C = (S_L1 × γ_L1 + S_L2 × γ_L2) + Tag_overhead")
@@ -572,8 +665,16 @@ def main():
     print(f"📁 Output directory: {OUTPUT_DIR}")
     print()
     
-    plot_cost_performance_tradeoff()
-    plot_cost_efficiency()
+    digest = _inputs_digest()
+    if not force and _plots_up_to_date(digest):
+        print("📊 Plots are up to date (use --force to regenerate)")
+    else:
+        # One figure shared by both plots: backend and font caches stay warm
+        fig = plt.figure()
+        plot_cost_performance_tradeoff(fig)
+        plot_cost_efficiency(fig)
+        plt.close(fig)
+        MANIFEST_PATH.write_text(digest + '\n')
     
     df = print_analysis_table()
     
@@ -587,4 +688,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate plots even if they are up to date')
+    args = parser.parse_args()
+    main(force=args.force)